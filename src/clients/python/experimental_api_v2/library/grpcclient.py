@@ -24,11 +24,30 @@
 # (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
 # OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
-import base64
+import os
+
+# Select protobuf's C++ backend before any generated module is
+# imported. The pure-Python implementation is orders of magnitude
+# slower at message (de)serialization, which dominates small-request
+# latency. An explicit user setting of the variable is respected.
+# When this client moves to a protobuf>=4.21 runtime the native upb
+# backend becomes the default and this selection (and the warning
+# below) can be dropped; 'upb' is not a valid value for the protobuf
+# 3.x runtimes this package supports, so it must not be set here.
+os.environ.setdefault('PROTOCOL_BUFFERS_PYTHON_IMPLEMENTATION', 'cpp')
+
+import binascii
+import warnings
+from concurrent.futures import ThreadPoolExecutor
 import numpy as np
 import grpc
-import rapidjson as json
-from google.protobuf.json_format import MessageToJson
+from google.protobuf.internal import api_implementation
+
+if api_implementation.Type() != 'cpp':
+    warnings.warn(
+        "protobuf is using its pure-Python implementation. Inference "
+        "will be significantly slower; install the protobuf package "
+        "with its C++ extension to remove this overhead.")
 
 from tritongrpcclient import grpc_service_v2_pb2
 from tritongrpcclient import grpc_service_v2_pb2_grpc
@@ -42,6 +61,74 @@ def raise_error_grpc(rpc_error):
         debug_details=rpc_error.debug_error_string()) from None
 
 
+def _message_to_dict(message):
+    """Convert a protobuf message to a dict. The JSON machinery is
+    imported lazily so clients that never request as_json output do
+    not pay its import cost at module load.
+    """
+    from google.protobuf.json_format import MessageToDict
+    return MessageToDict(message)
+
+
+# Default channel options tuned for inference workloads. Tensor
+# payloads routinely exceed gRPC's 4MB default message limit, and
+# keepalive pings make sure a long-idle channel detects a dead TCP
+# connection instead of stalling the next request.
+# https://grpc.io/grpc/core/group__grpc__arg__keys.html
+_DEFAULT_CHANNEL_OPTIONS = [
+    ('grpc.max_send_message_length', -1),
+    ('grpc.max_receive_message_length', -1),
+    ('grpc.keepalive_time_ms', 10000),
+    ('grpc.keepalive_timeout_ms', 5000),
+    ('grpc.keepalive_permit_without_calls', 1),
+    ('grpc.http2.max_pings_without_data', 0),
+    ('grpc.http2.min_time_between_pings_ms', 10000),
+]
+
+# The request messages for RPCs that carry no fields never change,
+# so a single shared instance avoids a protobuf allocation on every
+# call. This matters for high-frequency liveness/readiness polling.
+_SERVER_LIVE_REQUEST = grpc_service_v2_pb2.ServerLiveRequest()
+_SERVER_READY_REQUEST = grpc_service_v2_pb2.ServerReadyRequest()
+_SERVER_METADATA_REQUEST = grpc_service_v2_pb2.ServerMetadataRequest()
+_REPOSITORY_INDEX_REQUEST = grpc_service_v2_pb2.RepositoryIndexRequest()
+
+# The nested tensor message types, aliased so InferInput/InferOutput
+# construct them directly instead of allocating (and discarding) an
+# outer ModelInferRequest just to reach the nested type.
+_InferInputTensor = grpc_service_v2_pb2.ModelInferRequest.InferInputTensor
+_InferRequestedOutputTensor = \
+    grpc_service_v2_pb2.ModelInferRequest.InferRequestedOutputTensor
+
+# Maps a parameter value's Python type to the InferParameter field
+# that carries it. A single hash lookup replaces the per-call chain
+# of type checks, and the exact-type keys keep bool (a subclass of
+# int) mapped to bool_param.
+_PARAM_FIELD_BY_TYPE = {
+    int: 'int64_param',
+    bool: 'bool_param',
+    str: 'string_param',
+}
+
+
+def _set_tensor_parameter(parameters, key, value):
+    """Set 'parameters[key]' to 'value' in the InferParameter field
+    matching the value's type. Validation only runs on the failure
+    paths, so a correct call - the overwhelmingly common case when
+    parameters are re-set per request - costs one dict lookup and
+    one setattr. The protobuf map itself rejects non-string keys.
+    """
+    try:
+        field = _PARAM_FIELD_BY_TYPE[type(value)]
+    except KeyError:
+        raise_error("unsupported value type for the parameter")
+    try:
+        setattr(parameters[key], field, value)
+    except TypeError:
+        raise_error(
+            "only string data type for key is supported in parameters")
+
+
 class InferenceServerClient:
     """An InferenceServerClient object is used to perform any kind of
     communication with the InferenceServer using gRPC protocol.
@@ -53,7 +140,20 @@ class InferenceServerClient:
 
     verbose : bool
         If True generate verbose output. Default value is False.
-    
+
+    grpc_options : list
+        An optional list of (key, value) channel option tuples that
+        is merged over the client defaults, e.g.
+        [('grpc.keepalive_time_ms', 30000)]. Options not specified
+        here keep their default value. Default value is None.
+
+    compression : grpc.Compression
+        The channel-level compression algorithm to use for all calls,
+        e.g. grpc.Compression.Gzip. Compressing the tensor payload
+        trades client/server CPU for bandwidth, which can be a large
+        win on slow links. Default value is None which means no
+        compression.
+
     Raises
     ------
     Exception
@@ -61,12 +161,35 @@ class InferenceServerClient:
 
     """
 
-    def __init__(self, url, verbose=False):
-        # FixMe: Are any of the channel options worth exposing?
-        # https://grpc.io/grpc/core/group__grpc__arg__keys.html
-        self._channel = grpc.insecure_channel(url, options=None)
+    def __init__(self, url, verbose=False, grpc_options=None,
+                 compression=None):
+        channel_options = dict(_DEFAULT_CHANNEL_OPTIONS)
+        if grpc_options is not None:
+            channel_options.update(grpc_options)
+        self._channel = grpc.insecure_channel(
+            url,
+            options=list(channel_options.items()),
+            compression=compression)
         self._client_stub = grpc_service_v2_pb2_grpc.GRPCInferenceServiceStub(
             self._channel)
+        # Cache the bound RPC callables used on polling paths so each
+        # call skips an attribute lookup on the stub.
+        self._server_live = self._client_stub.ServerLive
+        self._server_ready = self._client_stub.ServerReady
+        self._model_ready = self._client_stub.ModelReady
+        # Likewise for the inference RPC itself - the hottest call
+        # sites in the module.
+        self._model_infer = self._client_stub.ModelInfer
+        self._model_infer_future = self._client_stub.ModelInfer.future
+        # Reusable request message for infer/async_infer. gRPC
+        # serializes the request before the call returns, so clearing
+        # and refilling one message per call avoids re-allocating the
+        # message and its nested repeated fields in the hot loop.
+        self._infer_request = grpc_service_v2_pb2.ModelInferRequest()
+        # Executor that runs async_infer callbacks, created on first
+        # use. Running user callbacks directly on gRPC's completion
+        # thread would stall the channel whenever a callback is slow.
+        self._callback_pool = None
         self._verbose = verbose
 
     def __enter__(self):
@@ -83,6 +206,9 @@ class InferenceServerClient:
         will result in an Error.
 
         """
+        if self._callback_pool is not None:
+            self._callback_pool.shutdown(wait=False)
+            self._callback_pool = None
         self._channel.close()
 
     def is_server_live(self):
@@ -100,8 +226,7 @@ class InferenceServerClient:
 
         """
         try:
-            request = grpc_service_v2_pb2.ServerLiveRequest()
-            response = self._client_stub.ServerLive(request)
+            response = self._server_live(_SERVER_LIVE_REQUEST)
             return response.live
         except grpc.RpcError as rpc_error:
             raise_error_grpc(rpc_error)
@@ -121,8 +246,7 @@ class InferenceServerClient:
 
         """
         try:
-            request = grpc_service_v2_pb2.ServerReadyRequest()
-            response = self._client_stub.ServerReady(request)
+            response = self._server_ready(_SERVER_READY_REQUEST)
             return response.ready
         except grpc.RpcError as rpc_error:
             raise_error_grpc(rpc_error)
@@ -154,7 +278,7 @@ class InferenceServerClient:
         try:
             request = grpc_service_v2_pb2.ModelReadyRequest(
                 name=model_name, version=model_version)
-            response = self._client_stub.ModelReady(request)
+            response = self._model_ready(request)
             return response.ready
         except grpc.RpcError as rpc_error:
             raise_error_grpc(rpc_error)
@@ -181,10 +305,10 @@ class InferenceServerClient:
 
         """
         try:
-            request = grpc_service_v2_pb2.ServerMetadataRequest()
-            response = self._client_stub.ServerMetadata(request)
+            response = self._client_stub.ServerMetadata(
+                _SERVER_METADATA_REQUEST)
             if as_json:
-                return json.loads(MessageToJson(response))
+                return _message_to_dict(response)
             else:
                 return response
         except grpc.RpcError as rpc_error:
@@ -222,7 +346,7 @@ class InferenceServerClient:
                 name=model_name, version=model_version)
             response = self._client_stub.ModelMetadata(request)
             if as_json:
-                return json.loads(MessageToJson(response))
+                return _message_to_dict(response)
             else:
                 return response
         except grpc.RpcError as rpc_error:
@@ -260,7 +384,7 @@ class InferenceServerClient:
                 name=model_name, version=model_version)
             response = self._client_stub.ModelConfig(request)
             if as_json:
-                return json.loads(MessageToJson(response))
+                return _message_to_dict(response)
             else:
                 return response
         except grpc.RpcError as rpc_error:
@@ -284,10 +408,10 @@ class InferenceServerClient:
 
         """
         try:
-            request = grpc_service_v2_pb2.RepositoryIndexRequest()
-            response = self._client_stub.RepositoryIndex(request)
+            response = self._client_stub.RepositoryIndex(
+                _REPOSITORY_INDEX_REQUEST)
             if as_json:
-                return json.loads(MessageToJson(response))
+                return _message_to_dict(response)
             else:
                 return response
         except grpc.RpcError as rpc_error:
@@ -367,7 +491,7 @@ class InferenceServerClient:
                 name=region_name)
             response = self._client_stub.SystemSharedMemoryStatus(request)
             if as_json:
-                return json.loads(MessageToJson(response))
+                return _message_to_dict(response)
             else:
                 return response
         except grpc.RpcError as rpc_error:
@@ -460,14 +584,18 @@ class InferenceServerClient:
                 name=region_name)
             response = self._client_stub.CudaSharedMemoryStatus(request)
             if as_json:
-                return json.loads(MessageToJson(response))
+                return _message_to_dict(response)
             else:
                 return response
         except grpc.RpcError as rpc_error:
             raise_error_grpc(rpc_error)
 
-    def register_cuda_shared_memory(self, name, raw_handle, device_id,
-                                    byte_size):
+    def register_cuda_shared_memory(self,
+                                    name,
+                                    raw_handle,
+                                    device_id,
+                                    byte_size,
+                                    already_decoded=False):
         """Request the server to register a system shared memory with the
         following specification.
 
@@ -475,23 +603,33 @@ class InferenceServerClient:
         ----------
         name : str
             The name of the region to register.
-        raw_handle : bytes 
-            The raw serialized cudaIPC handle in base64 encoding.
+        raw_handle : bytes
+            The raw serialized cudaIPC handle in base64 encoding, or
+            the already-decoded handle bytes if 'already_decoded' is
+            True.
         device_id : int
             The GPU device ID on which the cudaIPC handle was created.
         byte_size : int
             The size of the cuda shared memory region, in bytes.
+        already_decoded : bool
+            If True then 'raw_handle' is used as-is without base64
+            decoding. Useful to skip repeated decoding when the same
+            handle is registered many times. Default value is False.
 
         Raises
         ------
         InferenceServerException
-            If unable to register the specified cuda shared memory.     
+            If unable to register the specified cuda shared memory.
 
         """
+        if not already_decoded:
+            # a2b_base64 is a thin C wrapper and skips the Python-level
+            # validation layered on top of it by base64.b64decode.
+            raw_handle = binascii.a2b_base64(raw_handle)
         try:
             request = grpc_service_v2_pb2.CudaSharedMemoryRegisterRequest(
                 name=name,
-                raw_handle=base64.b64decode(raw_handle),
+                raw_handle=raw_handle,
                 device_id=device_id,
                 byte_size=byte_size)
             self._client_stub.CudaSharedMemoryRegister(request)
@@ -531,7 +669,7 @@ class InferenceServerClient:
               outputs,
               model_name,
               model_version="",
-              request_id=None):
+              request_id=""):
         """Run synchronous inference using the supplied 'inputs' requesting
         the outputs specified by 'outputs'.
 
@@ -552,8 +690,8 @@ class InferenceServerClient:
             a version based on the model and internal policy.
         request_id: str
             Optional identifier for the request. If specified will be returned
-            in the response. Default value is 'None' which means no request_id
-            will be used.
+            in the response. Default value is an empty string which means no
+            request_id will be used.
 
         Returns
         -------
@@ -571,19 +709,141 @@ class InferenceServerClient:
                                               model_version, request_id)
 
         try:
-            response = self._client_stub.ModelInfer(request)
+            response = self._model_infer(request)
             result = InferResult(response)
             return result
         except grpc.RpcError as rpc_error:
             raise_error_grpc(rpc_error)
 
+    def infer_raw(self,
+                  inputs,
+                  outputs,
+                  model_name,
+                  model_version="",
+                  request_id=""):
+        """Identical to infer() but returns the raw ModelInferResponse
+        protobuf message without wrapping it in an InferResult. Useful
+        for callers that forward or re-serialize the response and do
+        not need the tensor decoding helpers.
+
+        Parameters
+        ----------
+        inputs : list
+            A list of InferInput objects, each describing data for a input
+            tensor required by the model.
+        outputs : list
+            A list of InferOutput objects, each describing how the output
+            data must be returned. Only the output tensors present in the
+            list will be requested from the server.
+        model_name: str
+            The name of the model to run inference.
+        model_version: str
+            The version of the model to run inference. The default value
+            is an empty string which means then the server will choose
+            a version based on the model and internal policy.
+        request_id: str
+            Optional identifier for the request. If specified will be returned
+            in the response. Default value is an empty string which means no
+            request_id will be used.
+
+        Returns
+        -------
+        ModelInferResponse
+            The protobuf message holding the result of the inference.
+
+        Raises
+        ------
+        InferenceServerException
+            If server fails to perform inference.
+        """
+
+        request = self._get_inference_request(inputs, outputs, model_name,
+                                              model_version, request_id)
+
+        try:
+            return self._model_infer(request)
+        except grpc.RpcError as rpc_error:
+            raise_error_grpc(rpc_error)
+
+    def prepare_request(self,
+                        inputs,
+                        outputs,
+                        model_name,
+                        model_version="",
+                        request_id=""):
+        """Assemble a ModelInferRequest that can be reused across
+        repeated infer_with_request() calls.
+
+        The returned message is owned by the caller. For steady-state
+        serving where the model, tensor shapes and requested outputs
+        do not change between calls, build the request once and only
+        update request.inputs[i].contents.raw_contents per call -
+        after warmup no request assembly work remains.
+
+        Parameters
+        ----------
+        inputs : list
+            A list of InferInput objects, each describing data for a input
+            tensor required by the model.
+        outputs : list
+            A list of InferOutput objects, each describing how the output
+            data must be returned. Only the output tensors present in the
+            list will be requested from the server.
+        model_name: str
+            The name of the model to run inference.
+        model_version: str
+            The version of the model to run inference. The default value
+            is an empty string which means then the server will choose
+            a version based on the model and internal policy.
+        request_id: str
+            Optional identifier for the request. If specified will be returned
+            in the response. Default value is an empty string which means no
+            request_id will be used.
+
+        Returns
+        -------
+        ModelInferRequest
+            The protobuf message holding the inference request.
+
+        """
+        request = grpc_service_v2_pb2.ModelInferRequest()
+        request.CopyFrom(
+            self._get_inference_request(inputs, outputs, model_name,
+                                        model_version, request_id))
+        return request
+
+    def infer_with_request(self, request):
+        """Run synchronous inference using a request assembled by
+        prepare_request().
+
+        Parameters
+        ----------
+        request : ModelInferRequest
+            The request message to send to the server.
+
+        Returns
+        -------
+        InferResult
+            The object holding the result of the inference, including the
+            statistics.
+
+        Raises
+        ------
+        InferenceServerException
+            If server fails to perform inference.
+        """
+        try:
+            return InferResult(self._model_infer(request))
+        except grpc.RpcError as rpc_error:
+            raise_error_grpc(rpc_error)
+
     def async_infer(self,
                     callback,
                     inputs,
                     outputs,
                     model_name,
                     model_version="",
-                    request_id=None):
+                    request_id=""):
         """Run asynchronous inference using the supplied 'inputs' requesting
         the outputs specified by 'outputs'.
 
@@ -611,8 +871,8 @@ class InferenceServerClient:
             a version based on the model and internal policy.
         request_id: str
             Optional identifier for the request. If specified will be returned
-            in the response. Default value is 'None' which means no request_id
-            will be used.
+            in the response. Default value is an empty string which means no
+            request_id will be used.
     
         Raises
         ------
@@ -625,14 +885,21 @@ class InferenceServerClient:
                 result = InferResult(call_future.result())
             except grpc.RpcError as rpc_error:
                 raise_error_grpc(rpc_error)
-            callback(result=result)
+            # Hand the user callback off to the executor so a slow
+            # callback cannot back-pressure gRPC's completion thread
+            # and serialize otherwise-independent inferences. A single
+            # worker keeps callbacks running in completion order.
+            self._callback_pool.submit(callback, result=result)
 
         request = self._get_inference_request(inputs, outputs, model_name,
                                               model_version, request_id)
 
+        if self._callback_pool is None:
+            self._callback_pool = ThreadPoolExecutor(max_workers=1)
+
         try:
-            self._call_future = self._client_stub.ModelInfer.future(request)
-            self._call_future.add_done_callback(wrapped_callback)
+            call_future = self._model_infer_future(request)
+            call_future.add_done_callback(wrapped_callback)
         except grpc.RpcError as rpc_error:
             raise_error_grpc(rpc_error)
 
@@ -657,25 +924,30 @@ class InferenceServerClient:
             a version based on the model and internal policy.
         request_id: str
             Optional identifier for the request. If specified will be returned
-            in the response. Default value is 'None' which means no request_id
-            will be used.
+            in the response. Default value is an empty string which means no
+            request_id will be used.
 
         Returns
         -------
         ModelInferRequest
-            The protobuf message holding the inference request.
+            The protobuf message holding the inference request. The
+            message is owned by the client and reused by the next
+            infer/async_infer call, which is safe because gRPC
+            serializes it before the call returns.
 
         """
 
-        request = grpc_service_v2_pb2.ModelInferRequest()
+        request = self._infer_request
+        request.Clear()
         request.model_name = model_name
         request.model_version = model_version
-        if request_id != None:
-            request.id = request_id
-        for infer_input in inputs:
-            request.inputs.extend([infer_input._get_tensor()])
-        for infer_output in outputs:
-            request.outputs.extend([infer_output._get_tensor()])
+        # Proto3 treats the default '' the same as unset on the wire,
+        # so the id can be assigned unconditionally.
+        request.id = request_id or ''
+        request.inputs.extend(
+            infer_input._get_tensor() for infer_input in inputs)
+        request.outputs.extend(
+            infer_output._get_tensor() for infer_output in outputs)
 
         return request
 
@@ -692,8 +964,7 @@ class InferInput:
     """
 
     def __init__(self, name):
-        self._input = grpc_service_v2_pb2.ModelInferRequest().InferInputTensor()
-        self._input.name = name
+        self._input = _InferInputTensor(name=name)
 
     def name(self):
         """Get the name of input associated with this object.
@@ -762,14 +1033,60 @@ class InferInput:
         """
         if not isinstance(input_tensor, (np.ndarray,)):
             raise_error("input_tensor must be a numpy array")
-        self._input.datatype = np_to_triton_dtype(input_tensor.dtype)
-        self._input.ClearField('shape')
-        self._input.shape.extend(input_tensor.shape)
-        if self._input.datatype == "BYTES":
-            self._input.contents.raw_contents = serialize_byte_tensor(
-                input_tensor).tobytes()
+        datatype = np_to_triton_dtype(input_tensor.dtype)
+        if datatype == "BYTES":
+            raw_contents = serialize_byte_tensor(input_tensor).tobytes()
         else:
-            self._input.contents.raw_contents = input_tensor.tobytes()
+            # Normalize to a C-contiguous array up front so that the
+            # conversion to bytes below is a single memcpy rather than
+            # a strided element-by-element gather. For the common case
+            # of an already-contiguous tensor this is free, and exactly
+            # one copy is made into the protobuf field.
+            if not input_tensor.flags['C_CONTIGUOUS']:
+                input_tensor = np.ascontiguousarray(input_tensor)
+            raw_contents = input_tensor.tobytes()
+        # Building a fresh tensor message via the constructor fills
+        # name, datatype, shape and contents in one C-level call
+        # instead of a descriptor-mediated write per field.
+        tensor = _InferInputTensor(
+            name=self._input.name,
+            datatype=datatype,
+            shape=input_tensor.shape,
+            contents=grpc_service_v2_pb2.InferTensorContents(
+                raw_contents=raw_contents))
+        # Carry over any parameters set before the data (rare path).
+        for key, param in self._input.parameters.items():
+            tensor.parameters[key].CopyFrom(param)
+        self._input = tensor
+
+    def set_data_from_buffer(self, input_buffer, shape, datatype):
+        """Set the tensor data (datatype, shape, contents) directly
+        from a raw byte buffer for input associated with this object.
+
+        This is a lower-level alternative to set_data_from_numpy that
+        skips the dtype lookup and serialization. The buffer must
+        already hold the tensor bytes in row-major order as expected
+        by the server (for BYTES tensors, the length-prefixed
+        serialized form). Useful for repeated inference where the
+        caller maintains the encoded bytes and only a region changes
+        between requests.
+
+        Parameters
+        ----------
+        input_buffer : bytes
+            The tensor data as bytes or any object supporting the
+            buffer protocol.
+        shape : list
+            The shape of the tensor.
+        datatype : str
+            The Triton datatype of the tensor, e.g. 'FP32'.
+        """
+        self._input.datatype = datatype
+        self._input.ClearField('shape')
+        self._input.shape.extend(shape)
+        # bytes() is free when the caller already passes bytes and a
+        # single copy for buffer-protocol objects such as memoryview.
+        self._input.contents.raw_contents = bytes(input_buffer)
 
     def set_parameter(self, key, value):
         """Adds the specified key-value pair in the requested input parameters
@@ -777,24 +1094,12 @@ class InferInput:
         Parameters
         ----------
         key : str
-            The name of the parameter to be included in the request. 
+            The name of the parameter to be included in the request.
         value : str/int/bool
             The value of the parameter
-        
+
         """
-        if not type(key) is str:
-            raise_error(
-                "only string data type for key is supported in parameters")
-
-        param = self._input.parameters[key]
-        if type(value) is int:
-            param.int64_param = value
-        elif type(value) is bool:
-            param.bool_param = value
-        elif type(value) is str:
-            param.string_param = value
-        else:
-            raise_error("unsupported value type for the parameter")
+        _set_tensor_parameter(self._input.parameters, key, value)
 
     def _get_tensor(self):
         """Retrieve the underlying InferInputTensor message.
@@ -817,9 +1122,7 @@ class InferOutput:
     """
 
     def __init__(self, name):
-        self._output = grpc_service_v2_pb2.ModelInferRequest(
-        ).InferRequestedOutputTensor()
-        self._output.name = name
+        self._output = _InferRequestedOutputTensor(name=name)
 
     def name(self):
         """Get the name of output associated with this object.
@@ -842,19 +1145,7 @@ class InferOutput:
             The value of the parameter
         
         """
-        if not type(key) is str:
-            raise_error(
-                "only string data type for key is supported in parameters")
-
-        param = self._output.parameters[key]
-        if type(value) is int:
-            param.int64_param = value
-        elif type(value) is bool:
-            param.bool_param = value
-        elif type(value) is str:
-            param.string_param = value
-        else:
-            raise_error("unsupported value type for the parameter")
+        _set_tensor_parameter(self._output.parameters, key, value)
 
     def _get_tensor(self):
         """Retrieve the underlying InferRequestedOutputTensor message.
@@ -879,6 +1170,19 @@ class InferResult:
 
     def __init__(self, result):
         self._result = result
+        # Output tensors indexed by name so as_numpy is a dict lookup
+        # instead of a linear scan over the outputs per call.
+        self._output_index = {
+            output.name: output for output in result.outputs
+        }
+        # Decoded output tensors keyed by name, filled lazily so only
+        # the outputs the caller actually reads are decoded, and each
+        # is decoded once.
+        self._numpy_cache = {}
+        # Lazily-built dict forms of the statistics and the full
+        # response for the as_json accessors.
+        self._statistics_dict = None
+        self._response_dict = None
 
     def as_numpy(self, name):
         """Get the tensor data for output associated with this object
@@ -895,67 +1199,90 @@ class InferResult:
             The numpy array containing the response data for the tensor or
             None if the data for specified tensor name is not found.
         """
-        for output in self._result.outputs:
-            if output.name == name:
-                shape = []
-                for value in output.shape:
-                    shape.append(value)
-
-                datatype = output.datatype
-                if len(output.contents.raw_contents) != 0:
-                    if datatype == 'BYTES':
-                        # String results contain a 4-byte string length
-                        # followed by the actual string characters. Hence,
-                        # need to decode the raw bytes to convert into
-                        # array elements.
-                        np_array = deserialize_bytes_tensor(
-                            output.contents.raw_contents)
-                    else:
-                        np_array = np.frombuffer(
-                            output.contents.raw_contents,
-                            dtype=triton_to_np_dtype(datatype))
-                elif len(output.contents.byte_contents) != 0:
-                    np_array = np.array(output.contents.byte_contents)
-                np_array = np.resize(np_array, shape)
-                return np_array
-        return None
-
-    def get_statistics(self, as_json=False):
+        if name in self._numpy_cache:
+            return self._numpy_cache[name]
+        output = self._output_index.get(name)
+        if output is None:
+            return None
+
+        # The repeated field converts to a tuple in one C call; no
+        # need for a Python-level loop.
+        shape = tuple(output.shape)
+
+        datatype = output.datatype
+        # Read each protobuf field once into a local; every access of
+        # a bytes field goes through descriptor dispatch and, on the
+        # C++ backend, materializes a fresh bytes object the size of
+        # the tensor.
+        contents = output.contents
+        raw_contents = contents.raw_contents
+        if len(raw_contents) != 0:
+            if datatype == 'BYTES':
+                # String results contain a 4-byte string length
+                # followed by the actual string characters. Hence,
+                # need to decode the raw bytes to convert into
+                # array elements.
+                np_array = deserialize_bytes_tensor(raw_contents)
+            else:
+                np_array = np.frombuffer(
+                    raw_contents, dtype=triton_to_np_dtype(datatype))
+        elif len(contents.byte_contents) != 0:
+            # dtype=object keeps the bytes elements as-is and skips
+            # numpy's dtype-inference pass over the repeated field.
+            np_array = np.asarray(contents.byte_contents, dtype=object)
+        # reshape returns a view; np.resize would copy the
+        # whole array (and silently pad/truncate on a size
+        # mismatch, which is never the right outcome here).
+        np_array = np_array.reshape(shape)
+        self._numpy_cache[name] = np_array
+        return np_array
+
+    def get_statistics(self):
         """Retrieves the InferStatistics for this response as
-        a json dict object or protobuf message
+        a protobuf message
 
-        Parameters
-        ----------
-        as_json : bool
-            If True then returns statistics as a json dict, otherwise
-            as a protobuf message. Default value is False.
-        
         Returns
         -------
-        protobuf message or dict
-            The InferStatistics protobuf message or dict for this response.
+        protobuf message
+            The InferStatistics protobuf message for this response.
         """
-        if as_json:
-            return json.loads(MessageToJson(self._result.statistics))
-        else:
-            return self._result.statistics
+        return self._result.statistics
+
+    def get_statistics_as_json(self):
+        """Retrieves the InferStatistics for this response as
+        a json dict object. The conversion runs on the first call
+        and the dict is cached for subsequent calls.
 
-    def get_response(self, as_json=False):
+        Returns
+        -------
+        dict
+            The InferStatistics dict for this response.
+        """
+        if self._statistics_dict is None:
+            self._statistics_dict = _message_to_dict(self._result.statistics)
+        return self._statistics_dict
+
+    def get_response(self):
         """Retrieves the complete ModelInferResponse as a
-        json dict object or protobuf message
+        protobuf message
 
-        Parameters
-        ----------
-        as_json : bool
-            If True then returns response as a json dict, otherwise
-            as a protobuf message. Default value is False.
-    
         Returns
         -------
-        protobuf message or dict
-            The underlying ModelInferResponse as a protobuf message or dict.
+        protobuf message
+            The underlying ModelInferResponse as a protobuf message.
         """
-        if as_json:
-            return json.loads(MessageToJson(self._result))
-        else:
-            return self._result
+        return self._result
+
+    def get_response_as_json(self):
+        """Retrieves the complete ModelInferResponse as a
+        json dict object. The conversion runs on the first call
+        and the dict is cached for subsequent calls.
+
+        Returns
+        -------
+        dict
+            The underlying ModelInferResponse as a dict.
+        """
+        if self._response_dict is None:
+            self._response_dict = _message_to_dict(self._result)
+        return self._response_dict
@@ -27,6 +27,10 @@
 import numpy as np
 import struct
 
+# Prebound unpacker for the little-endian uint32 length prefix used
+# by the BYTES tensor wire format.
+_unpack_length_from = struct.Struct("<I").unpack_from
+
 __all__ = [
     'raise_error', 'np_to_triton_dtype', 'triton_to_np_dtype',
     'InferenceServerException', 'serialize_byte_tensor',
@@ -103,65 +107,52 @@ class InferenceServerException(Exception):
         return self._debug_details
 
 
+# Precomputed so the per-call mapping is a single dict lookup
+# instead of a chain of dtype comparisons. set_data_from_numpy calls
+# this on every inference.
+# FIXMEPV2 support np.bytes_ or np.str_
+_NP_TO_TRITON_DTYPE = {
+    np.dtype(np.bool): "BOOL",
+    np.dtype(np.int8): "INT8",
+    np.dtype(np.int16): "INT16",
+    np.dtype(np.int32): "INT32",
+    np.dtype(np.int64): "INT64",
+    np.dtype(np.uint8): "UINT8",
+    np.dtype(np.uint16): "UINT16",
+    np.dtype(np.uint32): "UINT32",
+    np.dtype(np.uint64): "UINT64",
+    np.dtype(np.float16): "FP16",
+    np.dtype(np.float32): "FP32",
+    np.dtype(np.float64): "FP64",
+    np.dtype(np.object): "BYTES"
+}
+
+
 def np_to_triton_dtype(np_dtype):
-    if np_dtype == np.bool:
-        return "BOOL"
-    elif np_dtype == np.int8:
-        return "INT8"
-    elif np_dtype == np.int16:
-        return "INT16"
-    elif np_dtype == np.int32:
-        return "INT32"
-    elif np_dtype == np.int64:
-        return "INT64"
-    elif np_dtype == np.uint8:
-        return "UINT8"
-    elif np_dtype == np.uint16:
-        return "UINT16"
-    elif np_dtype == np.uint32:
-        return "UINT32"
-    elif np_dtype == np.uint64:
-        return "UINT64"
-    elif np_dtype == np.float16:
-        return "FP16"
-    elif np_dtype == np.float32:
-        return "FP32"
-    elif np_dtype == np.float64:
-        return "FP64"
-    # FIXMEPV2 support np.bytes_ or np.str_
-    elif np_dtype == np.object:
-        return "BYTES"
-    return None
+    return _NP_TO_TRITON_DTYPE.get(np.dtype(np_dtype))
+
+
+# Inverse mapping, likewise precomputed; as_numpy calls this per
+# output tensor.
+_TRITON_TO_NP_DTYPE = {
+    "BOOL": np.bool,
+    "INT8": np.int8,
+    "INT16": np.int16,
+    "INT32": np.int32,
+    "INT64": np.int64,
+    "UINT8": np.uint8,
+    "UINT16": np.uint16,
+    "UINT32": np.uint32,
+    "UINT64": np.uint64,
+    "FP16": np.float16,
+    "FP32": np.float32,
+    "FP64": np.float64,
+    "BYTES": np.object
+}
 
 
 def triton_to_np_dtype(dtype):
-    if dtype == "BOOL":
-        return np.bool
-    elif dtype == "INT8":
-        return np.int8
-    elif dtype == "INT16":
-        return np.int16
-    elif dtype == "INT32":
-        return np.int32
-    elif dtype == "INT64":
-        return np.int64
-    elif dtype == "UINT8":
-        return np.uint8
-    elif dtype == "UINT16":
-        return np.uint16
-    elif dtype == "UINT32":
-        return np.uint32
-    elif dtype == "UINT64":
-        return np.uint64
-    elif dtype == "FP16":
-        return np.float16
-    elif dtype == "FP32":
-        return np.float32
-    elif dtype == "FP64":
-        return np.float64
-    elif dtype == "BYTES":
-        return np.object
-    return None
+    return _TRITON_TO_NP_DTYPE.get(dtype)
 
 
 def serialize_byte_tensor(input_tensor):
@@ -195,24 +186,37 @@ def serialize_byte_tensor(input_tensor):
     # order.
     if (input_tensor.dtype == np.object) or (
             input_tensor.dtype.type == np.bytes_):
-        flattened = bytes()
-        for obj in np.nditer(input_tensor, flags=["refs_ok"], order='C'):
+        # First pass encodes each element and accumulates the total
+        # payload size so a single output buffer can be preallocated.
+        # tolist() materializes the elements as native Python objects
+        # in one C-level pass, which is much cheaper than visiting
+        # them through np.nditer and per-element item() calls. A
+        # native-code packer would be faster still, but the client
+        # wheel is pure Python.
+        encoded = []
+        total_size = 0
+        for obj in input_tensor.ravel(order='C').tolist():
             # If directly passing bytes to BYTES type,
             # don't convert it to str as Python will encode the
             # bytes which may distort the meaning
-            if obj.dtype.type == np.bytes_:
-                if type(obj.item()) == bytes:
-                    s = obj.item()
-                else:
-                    s = bytes(obj)
+            if type(obj) is bytes:
+                s = obj
             else:
                 s = str(obj).encode('utf-8')
-            flattened += struct.pack("<I", len(s))
-            flattened += s
-        flattened_array = np.asarray(flattened)
-        if not flattened_array.flags['C_CONTIGUOUS']:
-            flattened_array = np.ascontiguousarray(flattened_array)
-        return flattened_array
+            encoded.append(s)
+            total_size += len(s)
+
+        # Second pass writes the 4-byte length prefix and payload of
+        # each element directly into the preallocated buffer.
+        flattened = bytearray(total_size + 4 * len(encoded))
+        offset = 0
+        for s in encoded:
+            length = len(s)
+            struct.pack_into("<I", flattened, offset, length)
+            offset += 4
+            flattened[offset:offset + length] = s
+            offset += length
+        return np.frombuffer(flattened, dtype=np.uint8)
     else:
         raise_error("cannot serialize bytes tensor: invalid datatype")
     return None
@@ -236,13 +240,20 @@ def deserialize_bytes_tensor(encoded_tensor):
         deserialized bytes in 'C' order.
    
     """
+    # Each element's offset depends on the length of the element
+    # before it, so the prefixes cannot all be read up front with a
+    # strided numpy view; the scan has to walk the buffer. Keep the
+    # per-element work minimal: one prebound C-level unpack for the
+    # length and one slice for the payload, instead of building and
+    # parsing a new struct format string per element.
     strs = list()
+    append = strs.append
     offset = 0
     val_buf = encoded_tensor
-    while offset < len(val_buf):
-        l = struct.unpack_from("<I", val_buf, offset)[0]
+    buf_len = len(val_buf)
+    while offset < buf_len:
+        l = _unpack_length_from(val_buf, offset)[0]
         offset += 4
-        sb = struct.unpack_from("<{}s".format(l), val_buf, offset)[0]
+        append(val_buf[offset:offset + l])
         offset += l
-        strs.append(sb)
     return (np.array(strs, dtype=str))